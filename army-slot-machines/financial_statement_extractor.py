@@ -1,8 +1,344 @@
+import numpy as np
 import pdfplumber
-import pandas as pd
+from pdfminer.pdfdocument import PDFDocument
+from pdfminer.pdfparser import PDFParser
+from pdfminer.pdftypes import resolve1
 
+import hashlib
+import heapq
+import itertools
+import json
+import os
+import pickle
 import re
-from typing import Dict, List
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from collections import OrderedDict
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    # pandas is imported lazily where DataFrames are built, so text-only callers skip its import cost
+    import pandas as pd
+
+# Statement markers in order of precedence; the first one present in the PDF wins.
+_STATEMENT_MARKERS = {
+    "Branch of Service": "branch_breakdown",
+    "Actual vs Budget": "operating_results",
+    "Statement of Financial Condition": "balance_sheet",
+}
+_STATEMENT_MARKER_RE = re.compile("|".join(re.escape(marker) for marker in _STATEMENT_MARKERS))
+
+# Category -> (start marker, end marker) of the line item sections on operating and branch statements
+_LINE_ITEM_SECTIONS = {
+    'revenue': ("Revenue", "Direct NAFI"),
+    'direct_reimbursement': ("Direct NAFI", "Net Revenue"),
+    'operating_expenses': ("Operating Expenses", "Total Operating Expenses"),
+}
+# Category -> (start marker, end marker) of the balance sheet sections
+_BALANCE_SHEET_SECTIONS = {
+    'assets': ("ASSETS", "LIABILITIES"),
+    'liabilities': ("LIABILITIES", "EQUITY"),
+    'equity': ("EQUITY", "TOTAL LIABILITIES"),
+}
+
+# Amount tokens such as "1,234.56" or "1,234.56-" (trailing '-' marks a negative amount)
+_AMOUNT_RE = re.compile(r'[\d,]+\.?\d*-?')
+# Line item name: everything before the first whitespace-separated number
+_ITEM_RE = re.compile(r'^(.+?)\s+[\d,]')
+# First characters of separator lines ("-----", "=====") skipped by the line item parser
+_SKIP_FIRST = frozenset('-=')
+# Balance sheet line: item name followed by a single amount at the end of the line. Matched over a
+# whole section at once; [^\S\n] is whitespace that cannot cross into the next line. The lookahead
+# requires a digit in the amount, so every match converts with float() once commas are removed.
+_BALANCE_ITEM_RE = re.compile(r'^[^\S\n]*(\S.*?)[^\S\n]+((?=,*\.?\d)[\d,]+\.?\d*)(-?)[^\S\n]*$', re.MULTILINE)
+# Prefixes removed from balance sheet item names
+_ITEM_PREFIX_RE = re.compile(r'^(?:Cash--|Less\s+)')
+
+# Per-character fields returned by extract_coordinate_columns() as float64 arrays
+_COORDINATE_KEYS = ('x0', 'y0', 'x1', 'y1', 'size')
+
+# Engines that can produce page text: pdfplumber (default, what the parsers were written against)
+# or PyMuPDF, a C-backed engine that is much faster but lays out spaces and line breaks differently
+_TEXT_ENGINES = ("pdfplumber", "pymupdf")
+
+# Documents with fewer pages are extracted serially; below this, worker start-up costs more than it saves
+_PARALLEL_MIN_PAGES = 4
+# Number of documents whose page texts are kept in memory across extractor instances
+_PAGE_TEXT_CACHE_SIZE = 32
+# Number of file hashes remembered by _file_digest(), e.g. one PDF per worker slice plus this module
+_FILE_DIGEST_CACHE_SIZE = 64
+# Pages per task when main.py or get_headers.py spread one large PDF over worker processes;
+# each task opens the PDF once for its pages
+PAGES_PER_TASK = 32
+
+
+def _extract_page_range_texts(pdf_path: str, page_range: range) -> List[str]:
+    """
+    Extract the text of a contiguous range of PDF pages.
+    
+    Defined at module scope so it can be pickled and run in a worker process. Opening a
+    PDF walks its whole page tree, which costs several page extractions on a large
+    document, so each task opens the PDF once for its whole range.
+    
+    Args:
+        pdf_path (str): Path to the PDF file.
+        page_range (range): Zero-based indices of the pages to extract.
+    
+    Returns:
+        List[str]: Text of each page in the range, or "" for pages without text.
+    """
+    texts = []
+    with pdfplumber.open(pdf_path, pages=[i + 1 for i in page_range]) as pdf:
+        for page in pdf.pages:
+            texts.append(page.extract_text() or "")
+            page.close()
+    return texts
+
+
+def count_pages(pdf_path: str) -> int:
+    """
+    Return the number of pages of a PDF from its page tree root.
+    
+    Only the cross-reference table and catalog are parsed, which is several times
+    cheaper than opening the PDF with pdfplumber and listing its pages.
+    
+    Args:
+        pdf_path (str): Path to the PDF file.
+    
+    Returns:
+        int: Page count recorded in the PDF's /Pages /Count entry.
+    """
+    with open(pdf_path, 'rb') as f:
+        document = PDFDocument(PDFParser(f))
+        return resolve1(resolve1(document.catalog['Pages'])['Count'])
+
+
+def _file_digest(path: str) -> str:
+    """
+    Return a content hash of a file, used as the key of the on-disk caches.
+    
+    The hash is remembered per (path, mtime, size), so the per-page extractors of one large
+    PDF hash it once rather than once per page.
+    
+    Args:
+        path (str): Path to the file.
+    
+    Returns:
+        str: Hex BLAKE2b digest (16 bytes) of the file contents.
+    """
+    stat = os.stat(path)
+    return _hash_file(path, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=_FILE_DIGEST_CACHE_SIZE)
+def _hash_file(path: str, mtime_ns: int, size: int) -> str:
+    """Hash a file for _file_digest(); mtime_ns and size only make the cache key."""
+    with open(path, 'rb') as f:
+        return hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16)).hexdigest()
+
+
+def _atomic_write(path: str, write_fn: Callable, mode: str = 'w') -> None:
+    """
+    Write a file through a temporary file that replaces it once complete.
+    
+    Concurrent readers, e.g. other worker processes sharing a cache directory, see either
+    the previous file or the complete new one, never a partial write. The parent directory
+    is created if needed.
+    
+    Args:
+        path (str): Destination file.
+        write_fn (Callable): Called with the open temporary file to write its contents.
+        mode (str): Open mode, 'w' (UTF-8 text) or 'wb'.
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_file = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_file, mode, encoding=None if 'b' in mode else 'utf-8') as f:
+        write_fn(f)
+    os.replace(tmp_file, path)
+
+
+def _cache_key(pdf_path: str) -> str:
+    """
+    Return the name stem of the on-disk cache entries for a PDF.
+    
+    Entries are keyed by the PDF's contents and by the source of this module, so a
+    modified PDF or a change to the extraction code starts new entries instead of
+    serving stale text or reports.
+    
+    Args:
+        pdf_path (str): Path to the PDF file.
+    
+    Returns:
+        str: "<hash of the PDF>_<hash of this module>".
+    """
+    return f"{_file_digest(pdf_path)}_{_file_digest(__file__)}"
+
+
+def _load_page_texts(pdf_path: str, cache_dir: Optional[str], read_pages: Callable[[], List[str]],
+                     refresh: bool = False, name_suffix: str = "") -> List[str]:
+    """
+    Extract the page texts of a PDF, going through an on-disk cache when cache_dir is set.
+    
+    Cache entries are stored as <cache_dir>/<_cache_key(pdf_path)><name_suffix>.json, so a file
+    that is modified, or a change to this module, gets a new entry, while renamed or copied
+    files reuse an existing one.
+    
+    Args:
+        pdf_path (str): Path to the PDF file.
+        cache_dir (str, optional): Directory of the on-disk cache. None disables it.
+        read_pages (Callable[[], List[str]]): Extracts the page texts on a cache miss.
+        refresh (bool): Re-extract the PDF and overwrite any existing cache entry.
+        name_suffix (str): Appended to the entry name to keep texts from other engines apart.
+    
+    Returns:
+        List[str]: Text of each page in document order.
+    """
+    if cache_dir is None:
+        return read_pages()
+    
+    cache_file = os.path.join(cache_dir, f"{_cache_key(pdf_path)}{name_suffix}.json")
+    
+    if not refresh and os.path.exists(cache_file):
+        with open(cache_file, encoding='utf-8') as f:
+            return json.load(f)
+    
+    page_texts = read_pages()
+    _atomic_write(cache_file, partial(json.dump, page_texts))
+    return page_texts
+
+
+# In-memory page text cache shared by extractor instances, least recently used first.
+# Keyed by (pdf_path, mtime_ns, size, cache_dir, text_engine, page_index) so that a PDF rewritten in place is re-extracted.
+_page_text_cache: "OrderedDict[Tuple, Tuple[str, ...]]" = OrderedDict()
+
+
+def _remember_page_texts(key: Tuple, page_texts: Tuple[str, ...]) -> None:
+    """
+    Store page texts in _page_text_cache, evicting the least recently used documents.
+    
+    Args:
+        key (Tuple): (pdf_path, mtime_ns, size, cache_dir, text_engine, page_index) of the document.
+        page_texts (Tuple[str, ...]): Text of each page in document order.
+    """
+    _page_text_cache[key] = page_texts
+    _page_text_cache.move_to_end(key)
+    while len(_page_text_cache) > _PAGE_TEXT_CACHE_SIZE:
+        _page_text_cache.popitem(last=False)
+
+
+def _percent(numerators, denominators) -> np.ndarray:
+    """
+    Compute numerator / denominator * 100 element-wise, using 0 where the denominator is 0.
+    
+    Args:
+        numerators: Sequence of numerators.
+        denominators: Sequence of denominators, same length as numerators.
+    
+    Returns:
+        np.ndarray: float64 array of percentages.
+    """
+    numerators = np.asarray(numerators, dtype=np.float64)
+    denominators = np.asarray(denominators, dtype=np.float64)
+    pct = np.zeros_like(numerators)
+    np.divide(numerators, denominators, out=pct, where=denominators != 0)
+    pct *= 100
+    return pct
+
+
+def _percent_column(numerators: List[float], denominators: List[float]) -> np.ndarray:
+    """
+    Compute a percentage column with _percent(), keeping integer zeros when nothing divides.
+    
+    The exported CSVs have always written an all-zero-denominator column as integer 0s
+    (e.g. pages with no budget), so that case is returned as int64 rather than 0.0.
+    
+    Args:
+        numerators (List[float]): Column of numerators.
+        denominators (List[float]): Column of denominators, same length as numerators.
+    
+    Returns:
+        np.ndarray: Percentages as float64, or int64 zeros if every denominator is 0.
+    """
+    pct = _percent(numerators, denominators)
+    if not np.any(np.asarray(denominators, dtype=np.float64)):
+        return pct.astype(np.int64)
+    return pct
+
+
+def _to_columns(financial_data: Dict, keys: Tuple[str, ...]) -> Dict[str, list]:
+    """
+    Flatten nested financial data into columns (structure of arrays).
+    
+    Args:
+        financial_data (Dict): Nested data as returned by extract_operating_results() or
+                               extract_branch_breakdown().
+        keys (Tuple[str, ...]): Value keys to turn into columns; missing values become 0.
+    
+    Returns:
+        Dict[str, list]: Column name -> list of values, with 'category' and 'line_item'
+                         followed by one column per key.
+    """
+    columns = {'category': [], 'line_item': []}
+    columns.update((key, []) for key in keys)
+    for category, items in financial_data.items():
+        for item_name, values in items.items():
+            columns['category'].append(category)
+            columns['line_item'].append(item_name)
+            for key in keys:
+                columns[key].append(values.get(key, 0))
+    return columns
+
+
+def _columns_to_frame(columns: Dict[str, list], categories: List[str]) -> "pd.DataFrame":
+    """
+    Build a DataFrame from a column dict in one constructor call.
+    
+    The 'category' column is stored as a pandas Categorical over the fixed categories of the
+    statement type, so frames of many pages concatenate without falling back to object dtype.
+    Numeric columns stay float64: float32 cannot hold amounts such as 31,638,455.25 to the cent.
+    
+    Args:
+        columns (Dict[str, list]): Column name -> values, all of equal length.
+        categories (List[str]): All possible values of the 'category' column, in order.
+    
+    Returns:
+        pd.DataFrame: The DataFrame, or an empty DataFrame without columns if there are
+                      no rows (matching what an empty list of row dicts produced).
+    """
+    import pandas as pd
+    
+    if not len(next(iter(columns.values()))):
+        return pd.DataFrame()
+    return pd.DataFrame(dict(columns, category=pd.Categorical(columns['category'], categories=categories)))
+
+
+def _parse_amounts(line: str, n: int) -> Optional[List[float]]:
+    """
+    Parse the first n amounts found on a line.
+    
+    Commas are stripped and a trailing '-' is treated as a negative sign.
+    
+    Args:
+        line (str): Line of statement text.
+        n (int): Number of amounts expected on the line.
+    
+    Returns:
+        Optional[List[float]]: The first n amounts, or None if the line has fewer than
+                               n amounts or one of them is not a valid number.
+    """
+    tokens = _AMOUNT_RE.findall(line)
+    if len(tokens) < n:
+        return None
+    
+    values = [0.0] * n
+    try:
+        for i in range(n):
+            token = tokens[i].replace(',', '')
+            values[i] = -float(token[:-1]) if token.endswith('-') else float(token)
+    except ValueError:
+        return None
+    return values
 
 class FinancialStatementExtractor:
     """
@@ -16,6 +352,11 @@ class FinancialStatementExtractor:
     The extractor uses pdfplumber to parse PDF content and provides structured data output
     in various formats including dictionaries, DataFrames, and summary reports.
     
+    An extractor covers either a whole PDF or, with page_index, a single page of a larger
+    PDF; iter_pages() walks all pages of a PDF that way while opening it only once. A
+    single-page extractor behaves like a split one-page PDF, so its page is numbered 1 in
+    table names and coordinates.
+    
     Example:
         >>> extractor = FinancialStatementExtractor("financial_statement.pdf")
         >>> statement_type = extractor.detect_statement_type()
@@ -23,22 +364,284 @@ class FinancialStatementExtractor:
         >>> summary = extractor.generate_summary_report()
     """
     
-    def __init__(self, pdf_path: str):
+    # Column names for the 6-column budget vs actual and 4-column branch breakdown formats
+    _BUDGET_KEYS = ('march_actual', 'march_budget', 'march_variance', 'ytd_actual', 'ytd_budget', 'ytd_variance')
+    _BRANCH_KEYS = ('armp_total', 'army', 'navy', 'usmc')
+    # Summary line identifier -> (category, item name) it is stored under
+    _SUMMARY_LINES = {
+        "Net Revenue": ('net_revenue', 'Net Revenue'),
+        "Net Operating Income": ('net_operating_income', 'Net Operating Income'),
+        "Interest Revenue": ('other_income', 'Interest Revenue'),
+        "Net Income/(Loss)": ('net_income', 'Net Income'),
+    }
+    
+    def __init__(self, pdf_path: str, cache_dir: Optional[str] = None, force_refresh: bool = False,
+                 text_engine: str = "pdfplumber", page_index: Optional[int] = None,
+                 pdf: Optional[pdfplumber.PDF] = None, n_workers: Optional[int] = 1):
         """
         Initialize the financial statement extractor.
         
         Args:
             pdf_path (str): Path to the PDF file containing the financial statement.
                           Must be a valid path to a readable PDF file.
+            cache_dir (str, optional): Directory for an on-disk cache of extracted page text,
+                                     e.g. "~/.cache/fse". Disabled by default.
+            force_refresh (bool): Re-extract the PDF even if its text is cached in memory or
+                                on disk. The on-disk entry is overwritten.
+            text_engine (str): Library used for page text, "pdfplumber" or "pymupdf". PyMuPDF is
+                             many times faster but spaces and breaks lines differently, so check
+                             its output before relying on it. Tables and coordinates always
+                             use pdfplumber.
+            page_index (int, optional): Zero-based index of the one page of pdf_path to extract,
+                                      as if it were a single-page PDF. Defaults to all pages.
+            pdf (pdfplumber.PDF, optional): pdf_path already opened with pdfplumber, shared with
+                                          other extractors (see iter_pages()). It is left open
+                                          by close(); by default the extractor opens its own.
+            n_workers (int, optional): Number of processes used to extract page text with
+                                     pdfplumber. The default of 1 extracts serially in this
+                                     process; None uses one process per CPU. A pool needs the
+                                     calling script to have an `if __name__ == "__main__":`
+                                     guard on spawn platforms such as macOS.
+        
+        Raises:
+            ValueError: If text_engine is not one of the supported engines, or n_workers is
+                        less than 1.
         
         Attributes:
             pdf_path (str): Stored path to the PDF file
+            cache_dir (str): Expanded cache directory, or None
+            force_refresh (bool): Whether cached page text is ignored
+            text_engine (str): Library used for page text
+            page_index (int): Index of the extracted page, or None for the whole PDF
+            n_workers (int): Number of text extraction processes (1 = serial), or None for one per CPU
             pages_data (List): Storage for page-specific data (currently unused)
             statement_type (str): Detected statement type, set automatically when needed
+            table_names (List[str]): Source names of the DataFrames returned by extract_tables()
         """
         self.pdf_path = pdf_path
+        self.cache_dir = os.path.expanduser(cache_dir) if cache_dir is not None else None
+        self.force_refresh = force_refresh
+        if text_engine not in _TEXT_ENGINES:
+            raise ValueError(f"text_engine must be one of {_TEXT_ENGINES}, got {text_engine!r}")
+        self.text_engine = text_engine
+        self.page_index = page_index
+        if n_workers is not None and n_workers < 1:
+            raise ValueError(f"n_workers must be at least 1, got {n_workers!r}")
+        self.n_workers = n_workers
         self.pages_data = []
         self.statement_type = None  # Will be detected automatically
+        self.table_names = []
+        self._pdf = pdf  # Opened lazily by _get_pdf(), released by close()
+        self._owns_pdf = pdf is None  # A shared handle is closed by whoever opened it
+        self._pdf_finalizer = None  # Closes an owned handle if the extractor is never closed
+        self._page_texts = None  # Filled lazily by _get_page_texts()
+        self._first_content_page = 0  # Set by detect_statement_type()
+        self._financial_data = None  # Memoized by extract_financial_data()
+    
+    @classmethod
+    def iter_pages(cls, pdf_path: str, page_indices: Optional[Iterable[int]] = None,
+                   **kwargs) -> Iterator["FinancialStatementExtractor"]:
+        """
+        Yield one single-page extractor per page of a PDF, all sharing one open PDF.
+        
+        Statements bound into one large PDF can be processed page by page without splitting
+        them into separate files first: the PDF is opened and its page tree parsed once, and
+        each page's cached layout is released once its extractor is done.
+        
+        Args:
+            pdf_path (str): Path to the PDF file.
+            page_indices (Iterable[int], optional): Zero-based pages to visit, in order.
+                                                   Defaults to every page.
+            **kwargs: Further FinancialStatementExtractor arguments, e.g. cache_dir.
+        
+        Yields:
+            FinancialStatementExtractor: Extractor for the next page. It is closed when the
+                                         next one is requested.
+        
+        Example:
+            >>> for extractor in FinancialStatementExtractor.iter_pages("statements.pdf"):
+            ...     report = format_report_df(extractor, fields=("dataframes",))
+        """
+        with pdfplumber.open(pdf_path) as pdf:
+            if page_indices is None:
+                page_indices = range(len(pdf.pages))
+            for page_index in page_indices:
+                with cls(pdf_path, page_index=page_index, pdf=pdf, **kwargs) as extractor:
+                    yield extractor
+    
+    def __enter__(self) -> "FinancialStatementExtractor":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """
+        Close the underlying PDF, if it was opened.
+        
+        An extractor that is never closed has the PDF it opened closed when it is garbage
+        collected; closing it (or using it in a with block) releases the file right away.
+        
+        Extracted page text stays available; a later call that needs the PDF itself
+        (tables or coordinates) reopens it. A shared PDF passed in by the caller stays open;
+        only the cached layout of this extractor's page is released.
+        """
+        if self._pdf is None:
+            return
+        if self._owns_pdf:
+            self._pdf_finalizer()  # Closes the PDF and detaches the finalizer
+        elif self.page_index is not None:
+            self._get_pages()[0].close()
+        self._pdf = None
+        self._owns_pdf = True
+    
+    def _get_pdf(self) -> pdfplumber.PDF:
+        """
+        Return the pdfplumber PDF for this extractor, opening it on first use.
+        
+        All methods share the one handle, so the document is parsed once and pdfplumber's
+        per-page layout cache is reused: the tables are found on the same page objects the
+        text was extracted from.
+        
+        Returns:
+            pdfplumber.PDF: The open PDF. For a single-page extractor that opened the PDF
+                            itself, only that page is loaded.
+        """
+        if self._pdf is None:
+            pages = None if self.page_index is None else [self.page_index + 1]
+            self._pdf = pdfplumber.open(self.pdf_path, pages=pages)
+            # Extractors used without close() or a with block release the file when collected
+            self._pdf_finalizer = weakref.finalize(self, self._pdf.close)
+        return self._pdf
+    
+    def _get_pages(self) -> List["pdfplumber.page.Page"]:
+        """
+        Return the pdfplumber pages this extractor covers.
+        
+        Returns:
+            List[pdfplumber.page.Page]: Every page, or just the page at page_index.
+        
+        Raises:
+            IndexError: If the PDF has no page at page_index.
+        """
+        pages = self._get_pdf().pages
+        if self.page_index is None:
+            return pages
+        page_number = self.page_index + 1
+        if not self._owns_pdf:
+            # A shared PDF holds every page
+            if self.page_index < len(pages):
+                return [pages[self.page_index]]
+        else:
+            # _get_pdf() loaded only the selected page
+            for page in pages:
+                if page.page_number == page_number:
+                    return [page]
+        raise IndexError(f"{self.pdf_path} has no page {page_number}")
+    
+    def _page_number(self, page: "pdfplumber.page.Page") -> int:
+        """
+        Return the 1-based number of a page as seen by this extractor.
+        
+        A single-page extractor numbers its page 1, like the split page PDF it stands in for,
+        so table names and coordinates match between split-file and full-PDF runs.
+        
+        Args:
+            page (pdfplumber.page.Page): One of the pages returned by _get_pages().
+        
+        Returns:
+            int: The page's number in the PDF, or 1 for a single-page extractor.
+        """
+        return page.page_number if self.page_index is None else 1
+    
+    def _cache_name_suffix(self) -> str:
+        """
+        Return the suffix that keeps cache entries of single pages and other engines apart.
+        
+        Returns:
+            str: e.g. "" for the whole PDF with pdfplumber, "_page3_pymupdf" otherwise.
+        """
+        suffix = "" if self.page_index is None else f"_page{self.page_index}"
+        if self.text_engine != "pdfplumber":
+            suffix += f"_{self.text_engine}"
+        return suffix
+    
+    def _read_page_texts(self) -> List[str]:
+        """
+        Extract the text of every page of the PDF.
+        
+        Pages are extracted serially unless the extractor was created with n_workers above 1
+        (or None, one per CPU). pdfminer.six is pure Python and bound by the GIL, so such
+        documents with at least _PARALLEL_MIN_PAGES pages are extracted in a process pool
+        instead; the pages are split into one contiguous range per worker, and each worker
+        opens the PDF once.
+        
+        With text_engine="pymupdf" the whole document is read by PyMuPDF in this process.
+        
+        Returns:
+            List[str]: Text of each page in document order (only the page at page_index when
+                       set). Pages without text yield "".
+        """
+        if self.text_engine == "pymupdf":
+            import pymupdf
+            
+            with pymupdf.open(self.pdf_path) as doc:
+                pages = doc if self.page_index is None else [doc[self.page_index]]
+                return [page.get_text() for page in pages]
+        
+        n_workers = self.n_workers if self.n_workers is not None else os.cpu_count() or 1
+        # The page count is only needed, and the trailer only parsed, when a pool may be used
+        n_pages = 1 if n_workers == 1 or self.page_index is not None else count_pages(self.pdf_path)
+        if n_pages < _PARALLEL_MIN_PAGES:
+            return [page.extract_text() or "" for page in self._get_pages()]
+        
+        n_tasks = min(n_workers, n_pages)
+        bounds = [n_pages * i // n_tasks for i in range(n_tasks + 1)]
+        page_ranges = [range(start, stop) for start, stop in zip(bounds, bounds[1:])]
+        with ProcessPoolExecutor(max_workers=n_tasks) as executor:
+            texts = executor.map(partial(_extract_page_range_texts, self.pdf_path), page_ranges)
+            return list(itertools.chain.from_iterable(texts))
+    
+    def _get_page_texts(self) -> List[str]:
+        """
+        Return the extracted text of every page, parsing the PDF only once.
+        
+        Opening a PDF with pdfplumber re-parses it with pdfminer.six, which dominates the
+        cost of every extraction method. The per-page text is therefore extracted on first
+        use and cached on the instance so all downstream methods share it.
+        
+        Page texts are also kept in a per-process LRU cache keyed by (pdf_path, mtime, size,
+        cache_dir, text_engine, page_index), and in cache_dir when one is given, so re-running
+        extractors on the same PDF skips pdfminer entirely.
+        
+        Returns:
+            List[str]: Text of each page in document order. Pages without text yield "".
+        """
+        if self._page_texts is None:
+            stat = os.stat(self.pdf_path)
+            key = (self.pdf_path, stat.st_mtime_ns, stat.st_size, self.cache_dir, self.text_engine, self.page_index)
+            page_texts = None if self.force_refresh else _page_text_cache.get(key)
+            if page_texts is None:
+                page_texts = tuple(_load_page_texts(self.pdf_path, self.cache_dir, self._read_page_texts,
+                                                    refresh=self.force_refresh,
+                                                    name_suffix=self._cache_name_suffix()))
+            _remember_page_texts(key, page_texts)
+            self._page_texts = list(page_texts)
+        return self._page_texts
+    
+    def _content_page_texts(self) -> List[str]:
+        """
+        Return the text of the pages from the first one carrying any statement marker onwards.
+        
+        Title or cover pages in front of every statement cannot hold its data, so the data
+        extractors skip them. Pages of a lower-precedence statement that come before the
+        winning marker are kept. If no marker is found, every page is returned.
+        
+        Returns:
+            List[str]: Text of each content page in document order.
+        """
+        self.detect_statement_type()
+        return self._get_page_texts()[self._first_content_page:]
     
     def extract_all_text(self) -> str:
         """
@@ -54,13 +657,9 @@ class FinancialStatementExtractor:
             FileNotFoundError: If the PDF file path does not exist.
             Exception: If the PDF file is corrupted or cannot be opened.
         """
-        full_text = ""
-        with pdfplumber.open(self.pdf_path) as pdf:
-            for page in pdf.pages:
-                full_text += page.extract_text() + "\n"
-        return full_text
+        return "".join(text + "\n" for text in self._get_page_texts())
     
-    def extract_tables(self) -> List[pd.DataFrame]:
+    def extract_tables(self) -> List["pd.DataFrame"]:
         """
         Extract all tables from the PDF as pandas DataFrames.
         
@@ -69,21 +668,25 @@ class FinancialStatementExtractor:
         
         Returns:
             List[pd.DataFrame]: List of DataFrames, one for each table found.
-                                Each DataFrame has a 'name' attribute indicating its source
-                                (e.g., "Page_1_Table_1"). Returns empty list if no tables found.
+                                Returns empty list if no tables found. The source of each
+                                table (e.g., "Page_1_Table_1") is recorded at the same
+                                position in self.table_names.
         
         Note:
             Only non-empty tables are processed. Tables with no data are skipped.
+            Pages before the first page carrying any statement marker are not searched.
         """
+        import pandas as pd
+        
         tables = []
-        with pdfplumber.open(self.pdf_path) as pdf:
-            for i, page in enumerate(pdf.pages):
-                page_tables = page.extract_tables()
-                for j, table in enumerate(page_tables):
-                    if table:  # Only process non-empty tables
-                        df = pd.DataFrame(table[1:], columns=table[0])  # First row as headers
-                        df.name = f"Page_{i+1}_Table_{j+1}"
-                        tables.append(df)
+        self.table_names = []
+        self.detect_statement_type()
+        for page in self._get_pages()[self._first_content_page:]:
+            page_tables = page.extract_tables()
+            for j, table in enumerate(page_tables):
+                if table:  # Only process non-empty tables
+                    tables.append(pd.DataFrame.from_records(table[1:], columns=table[0]))  # First row as headers
+                    self.table_names.append(f"Page_{self._page_number(page)}_Table_{j+1}")
         return tables
     
     def detect_statement_type(self) -> str:
@@ -91,6 +694,10 @@ class FinancialStatementExtractor:
         Automatically detect the type of financial statement in the PDF.
         
         Analyzes the text content to identify key phrases that indicate the statement type.
+        Pages are scanned one at a time with a single combined pattern, stopping as soon as
+        the highest-precedence marker ("Branch of Service") is seen. The result is stored in
+        self.statement_type and returned directly on later calls, and the first page carrying
+        any marker is recorded so the extractors can skip the unmarked pages in front of it.
         
         Returns:
             str: One of the following statement types:
@@ -104,19 +711,22 @@ class FinancialStatementExtractor:
             >>> stmt_type = extractor.detect_statement_type()
             >>> print(stmt_type)  # "operating_results"
         """
-        with pdfplumber.open(self.pdf_path) as pdf:
-            full_text = ""
-            for page in pdf.pages:
-                full_text += page.extract_text() + "\n"
-            
-            if "Branch of Service" in full_text:
-                return "branch_breakdown"
-            elif "Actual vs Budget" in full_text:
-                return "operating_results"
-            elif "Statement of Financial Condition" in full_text:
-                return "balance_sheet"
-            else:
-                return "unknown"
+        if self.statement_type is not None:
+            return self.statement_type
+        
+        first_pages = {}  # marker -> index of the first page it appears on
+        for i, text in enumerate(self._get_page_texts()):
+            for marker in _STATEMENT_MARKER_RE.findall(text):
+                first_pages.setdefault(marker, i)
+            if "Branch of Service" in first_pages:
+                break
+        
+        self.statement_type = next(
+            (statement_type for marker, statement_type in _STATEMENT_MARKERS.items() if marker in first_pages),
+            "unknown",
+        )
+        self._first_content_page = min(first_pages.values(), default=0)
+        return self.statement_type
     
     def extract_operating_results(self) -> Dict[str, Dict[str, Dict[str, float]]]:
         """
@@ -158,60 +768,43 @@ class FinancialStatementExtractor:
             'distributions': {}
         }
         
-        with pdfplumber.open(self.pdf_path) as pdf:
-            for page in pdf.pages:
-                text = page.extract_text()
-                
-                # Extract different sections of the operating statement
-                revenue_section = self._extract_section(text, "Revenue", "Direct NAFI")
-                operating_data['revenue'].update(self._parse_budget_actual_items(revenue_section))
-                
-                reimbursement_section = self._extract_section(text, "Direct NAFI", "Net Revenue")
-                operating_data['direct_reimbursement'].update(self._parse_budget_actual_items(reimbursement_section))
-                
-                expenses_section = self._extract_section(text, "Operating Expenses", "Total Operating Expenses")
-                operating_data['operating_expenses'].update(self._parse_budget_actual_items(expenses_section))
-                
-                # Extract summary lines
-                net_revenue = self._extract_summary_line(text, "Net Revenue")
-                if net_revenue:
-                    operating_data['net_revenue']['Net Revenue'] = net_revenue
-                
-                net_operating = self._extract_summary_line(text, "Net Operating Income")
-                if net_operating:
-                    operating_data['net_operating_income']['Net Operating Income'] = net_operating
-                
-                interest_revenue = self._extract_summary_line(text, "Interest Revenue")
-                if interest_revenue:
-                    operating_data['other_income']['Interest Revenue'] = interest_revenue
-                
-                net_income = self._extract_summary_line(text, "Net Income/(Loss)")
-                if net_income:
-                    operating_data['net_income']['Net Income'] = net_income
+        for text in self._content_page_texts():
+            # Extract different sections of the operating statement
+            sections = self._extract_sections(text, _LINE_ITEM_SECTIONS)
+            for category, section_text in sections.items():
+                operating_data[category].update(self._parse_line_items(section_text, self._BUDGET_KEYS))
+            
+            # Extract summary lines
+            summary_lines = self._extract_summary_lines(text, tuple(self._SUMMARY_LINES), self._BUDGET_KEYS)
+            for line_identifier, values in summary_lines.items():
+                category, item_name = self._SUMMARY_LINES[line_identifier]
+                operating_data[category][item_name] = values
         
         return operating_data
     
-    def _parse_budget_actual_items(self, section_text: str) -> Dict[str, Dict[str, float]]:
+    def _parse_line_items(self, section_text: str, keys: Tuple[str, ...]) -> Dict[str, Dict[str, float]]:
         """
-        Parse line items with 6-column budget vs actual format.
+        Parse line items with a fixed number of amount columns.
         
-        Extracts financial line items that contain March and YTD budget vs actual data.
-        Uses regex to identify lines with 6 numeric values and parses them into structured data.
+        Extracts financial line items followed by one amount per entry in ``keys`` and
+        labels the parsed values with those keys. Used for both the 6-column budget vs
+        actual format (_BUDGET_KEYS) and the 4-column branch breakdown format (_BRANCH_KEYS).
         
         Args:
             section_text (str): Text section containing financial line items to parse.
+            keys (Tuple[str, ...]): Column names, in the order the amounts appear on each line.
         
         Returns:
-            Dict[str, Dict[str, float]]: Dictionary mapping item names to their financial data:
+            Dict[str, Dict[str, float]]: Dictionary mapping item names to their column data:
                 {
                     'Item Name': {
-                        'march_actual': float, 'march_budget': float, 'march_variance': float,
-                        'ytd_actual': float, 'ytd_budget': float, 'ytd_variance': float
+                        'march_actual': float, 'march_budget': float, ...  # or
+                        'armp_total': float, 'army': float, ...
                     }
                 }
         
         Note:
-            - Expects 6 columns: Mar Actual, Mar Budget, Mar Variance, YTD Actual, YTD Budget, YTD Variance
+            - Lines with fewer amounts than ``keys`` are skipped
             - Handles negative amounts (indicated by trailing '-')
             - Skips separator lines (starting with '-' or '=')
         """
@@ -220,87 +813,55 @@ class FinancialStatementExtractor:
         
         for line in lines:
             line = line.strip()
-            if not line or line.startswith('-') or line.startswith('='):
+            if not line or line[0] in _SKIP_FIRST:
                 continue
             
-            # Look for lines with multiple financial amounts (6 columns expected)
-            # Pattern: Item Name followed by 6 numeric values
-            amounts = re.findall(r'[\d,]+\.?\d*-?', line)
+            # Look for lines with an item name followed by len(keys) numeric values
+            values = _parse_amounts(line, len(keys))
+            if values is None:
+                continue
             
-            if len(amounts) >= 6:
-                # Extract item name (everything before the first number)
-                item_match = re.match(r'^(.+?)\s+[\d,]', line)
-                if item_match:
-                    item_name = item_match.group(1).strip()
-                    
-                    try:
-                        # Parse the 6 columns: Mar Actual, Mar Budget, Mar Variance, YTD Actual, YTD Budget, YTD Variance
-                        values = []
-                        for amount_str in amounts[:6]:
-                            clean_amount = amount_str.replace(',', '')
-                            if clean_amount.endswith('-'):
-                                values.append(-float(clean_amount[:-1]))
-                            else:
-                                values.append(float(clean_amount))
-                        
-                        items[item_name] = {
-                            'march_actual': values[0],
-                            'march_budget': values[1],
-                            'march_variance': values[2],
-                            'ytd_actual': values[3],
-                            'ytd_budget': values[4],
-                            'ytd_variance': values[5]
-                        }
-                    except (ValueError, IndexError):
-                        continue
+            # Extract item name (everything before the first number)
+            item_match = _ITEM_RE.match(line)
+            if item_match:
+                items[item_match.group(1).strip()] = dict(zip(keys, values))
         
         return items
     
-    def _extract_summary_line(self, text: str, line_identifier: str) -> Dict[str, float]:
+    def _extract_summary_lines(self, text: str, line_identifiers: Tuple[str, ...], keys: Tuple[str, ...]) -> Dict[str, Dict[str, float]]:
         """
-        Extract a single summary line with 6-column budget vs actual data.
+        Extract several summary lines with a fixed number of amount columns in one pass.
         
-        Searches for a specific line identifier and extracts the associated financial data
-        in the same 6-column format as line items.
+        Splits the text into lines once and checks every identifier against each line, so
+        all summary lines of a page are found with a single scan. For each identifier the
+        first line that contains it and parses in the same column format as
+        _parse_line_items() is used.
         
         Args:
             text (str): Full text to search within.
-            line_identifier (str): Unique text to identify the target line (e.g., "Net Revenue").
+            line_identifiers (Tuple[str, ...]): Unique texts identifying the target lines
+                                                (e.g., "Net Revenue", "Net Income/(Loss)").
+            keys (Tuple[str, ...]): Column names, in the order the amounts appear on each line.
         
         Returns:
-            Dict[str, float]: Dictionary with budget vs actual data:
-                {
-                    'march_actual': float, 'march_budget': float, 'march_variance': float,
-                    'ytd_actual': float, 'ytd_budget': float, 'ytd_variance': float
-                }
-                Returns empty dict if line not found or parsing fails.
+            Dict[str, Dict[str, float]]: Dictionary mapping each identifier that was found to
+                its column data, e.g.
+                {'Net Revenue': {'armp_total': float, 'army': float, 'navy': float, 'usmc': float}}
+                Identifiers with no matching line are omitted.
         """
-        lines = text.split('\n')
-        
-        for line in lines:
-            if line_identifier in line:
-                amounts = re.findall(r'[\d,]+\.?\d*-?', line)
-                if len(amounts) >= 6:
-                    try:
-                        values = []
-                        for amount_str in amounts[:6]:
-                            clean_amount = amount_str.replace(',', '')
-                            if clean_amount.endswith('-'):
-                                values.append(-float(clean_amount[:-1]))
-                            else:
-                                values.append(float(clean_amount))
-                        
-                        return {
-                            'march_actual': values[0],
-                            'march_budget': values[1],
-                            'march_variance': values[2],
-                            'ytd_actual': values[3],
-                            'ytd_budget': values[4],
-                            'ytd_variance': values[5]
-                        }
-                    except (ValueError, IndexError):
-                        continue
-        return {}
+        found = {}
+        remaining = list(line_identifiers)
+        
+        for line in text.split('\n'):
+            for line_identifier in [i for i in remaining if i in line]:
+                values = _parse_amounts(line, len(keys))
+                if values is None:
+                    break  # Same line for every identifier, so none of them can match here
+                found[line_identifier] = dict(zip(keys, values))
+                remaining.remove(line_identifier)
+            if not remaining:
+                break
+        return found
     
     def extract_branch_breakdown(self) -> Dict[str, Dict[str, Dict[str, float]]]:
         """
@@ -341,142 +902,19 @@ class FinancialStatementExtractor:
             'distributions': {}
         }
         
-        with pdfplumber.open(self.pdf_path) as pdf:
-            for page in pdf.pages:
-                text = page.extract_text()
-                
-                # Extract different sections with branch breakdown
-                revenue_section = self._extract_section(text, "Revenue", "Direct NAFI")
-                branch_data['revenue'].update(self._parse_branch_items(revenue_section))
-                
-                reimbursement_section = self._extract_section(text, "Direct NAFI", "Net Revenue")
-                branch_data['direct_reimbursement'].update(self._parse_branch_items(reimbursement_section))
-                
-                expenses_section = self._extract_section(text, "Operating Expenses", "Total Operating Expenses")
-                branch_data['operating_expenses'].update(self._parse_branch_items(expenses_section))
-                
-                # Extract summary lines
-                net_revenue = self._extract_branch_summary_line(text, "Net Revenue")
-                if net_revenue:
-                    branch_data['net_revenue']['Net Revenue'] = net_revenue
-                
-                net_operating = self._extract_branch_summary_line(text, "Net Operating Income")
-                if net_operating:
-                    branch_data['net_operating_income']['Net Operating Income'] = net_operating
-                
-                interest_revenue = self._extract_branch_summary_line(text, "Interest Revenue")
-                if interest_revenue:
-                    branch_data['other_income']['Interest Revenue'] = interest_revenue
-                
-                net_income = self._extract_branch_summary_line(text, "Net Income/(Loss)")
-                if net_income:
-                    branch_data['net_income']['Net Income'] = net_income
-        
-        return branch_data
-    
-    def _parse_branch_items(self, section_text: str) -> Dict[str, Dict[str, float]]:
-        """
-        Parse line items with 4-column branch breakdown format.
-        
-        Extracts financial line items that contain data broken down by military branch.
-        Uses regex to identify lines with 4 numeric values and parses them into structured data.
-        
-        Args:
-            section_text (str): Text section containing financial line items to parse.
-        
-        Returns:
-            Dict[str, Dict[str, float]]: Dictionary mapping item names to their branch data:
-                {
-                    'Item Name': {
-                        'armp_total': float, 'army': float, 'navy': float, 'usmc': float
-                    }
-                }
-        
-        Note:
-            - Expects 4 columns: ARMP Total, Army, Navy, USMC
-            - Handles negative amounts (indicated by trailing '-')
-            - Skips separator lines (starting with '-' or '=')
-        """
-        items = {}
-        lines = section_text.split('\n')
-        
-        for line in lines:
-            line = line.strip()
-            if not line or line.startswith('-') or line.startswith('='):
-                continue
-            
-            # Look for lines with 4 financial amounts (ARMP Total, Army, Navy, USMC)
-            amounts = re.findall(r'[\d,]+\.?\d*-?', line)
+        for text in self._content_page_texts():
+            # Extract different sections of the branch breakdown
+            sections = self._extract_sections(text, _LINE_ITEM_SECTIONS)
+            for category, section_text in sections.items():
+                branch_data[category].update(self._parse_line_items(section_text, self._BRANCH_KEYS))
             
-            if len(amounts) >= 4:
-                # Extract item name (everything before the first number)
-                item_match = re.match(r'^(.+?)\s+[\d,]', line)
-                if item_match:
-                    item_name = item_match.group(1).strip()
-                    
-                    try:
-                        # Parse the 4 columns: ARMP Total, Army, Navy, USMC
-                        values = []
-                        for amount_str in amounts[:4]:
-                            clean_amount = amount_str.replace(',', '')
-                            if clean_amount.endswith('-'):
-                                values.append(-float(clean_amount[:-1]))
-                            else:
-                                values.append(float(clean_amount))
-                        
-                        items[item_name] = {
-                            'armp_total': values[0],
-                            'army': values[1],
-                            'navy': values[2],
-                            'usmc': values[3]
-                        }
-                    except (ValueError, IndexError):
-                        continue
-        
-        return items
-    
-    def _extract_branch_summary_line(self, text: str, line_identifier: str) -> Dict[str, float]:
-        """
-        Extract a single summary line with 4-column branch breakdown data.
-        
-        Searches for a specific line identifier and extracts the associated financial data
-        in the same 4-column format as branch line items.
-        
-        Args:
-            text (str): Full text to search within.
-            line_identifier (str): Unique text to identify the target line (e.g., "Net Revenue").
-        
-        Returns:
-            Dict[str, float]: Dictionary with branch breakdown data:
-                {
-                    'armp_total': float, 'army': float, 'navy': float, 'usmc': float
-                }
-                Returns empty dict if line not found or parsing fails.
-        """
-        lines = text.split('\n')
+            # Extract summary lines
+            summary_lines = self._extract_summary_lines(text, tuple(self._SUMMARY_LINES), self._BRANCH_KEYS)
+            for line_identifier, values in summary_lines.items():
+                category, item_name = self._SUMMARY_LINES[line_identifier]
+                branch_data[category][item_name] = values
         
-        for line in lines:
-            if line_identifier in line:
-                amounts = re.findall(r'[\d,]+\.?\d*-?', line)
-                if len(amounts) >= 4:
-                    try:
-                        values = []
-                        for amount_str in amounts[:4]:
-                            clean_amount = amount_str.replace(',', '')
-                            if clean_amount.endswith('-'):
-                                values.append(-float(clean_amount[:-1]))
-                            else:
-                                values.append(float(clean_amount))
-                        
-                        return {
-                            'armp_total': values[0],
-                            'army': values[1],
-                            'navy': values[2],
-                            'usmc': values[3]
-                        }
-                    except (ValueError, IndexError):
-                        continue
-        return {}
+        return branch_data
     
     def calculate_branch_performance(self, branch_data: Dict) -> Dict[str, Dict[str, float]]:
         """
@@ -509,15 +947,17 @@ class FinancialStatementExtractor:
         
         # Calculate revenue share by branch
         if 'revenue' in branch_data:
-            revenue_items = branch_data['revenue']
-            for item_name, values in revenue_items.items():
-                if isinstance(values, dict) and values.get('armp_total', 0) != 0:
-                    total = values['armp_total']
-                    performance[item_name] = {
-                        'army_share_pct': (values['army'] / total * 100) if total != 0 else 0,
-                        'navy_share_pct': (values['navy'] / total * 100) if total != 0 else 0,
-                        'usmc_share_pct': (values['usmc'] / total * 100) if total != 0 else 0
-                    }
+            revenue_items = {
+                item_name: values for item_name, values in branch_data['revenue'].items()
+                if values.get('armp_total', 0) != 0
+            }
+            totals = [values['armp_total'] for values in revenue_items.values()]
+            shares = {
+                f'{branch}_share_pct': _percent([values[branch] for values in revenue_items.values()], totals).tolist()
+                for branch in ('army', 'navy', 'usmc')
+            }
+            for i, item_name in enumerate(revenue_items):
+                performance[item_name] = {key: pcts[i] for key, pcts in shares.items()}
         
         # Calculate profit margins by branch
         if 'net_operating_income' in branch_data and 'revenue' in branch_data:
@@ -531,11 +971,15 @@ class FinancialStatementExtractor:
                     break
             
             if net_income and total_revenue:
+                margins = _percent(
+                    [net_income.get(key, 0) for key in self._BRANCH_KEYS],
+                    [total_revenue.get(key, 0) for key in self._BRANCH_KEYS],
+                ).tolist()
                 performance['Operating Margin'] = {
-                    'army_margin_pct': (net_income.get('army', 0) / total_revenue.get('army', 1) * 100) if total_revenue.get('army', 0) != 0 else 0,
-                    'navy_margin_pct': (net_income.get('navy', 0) / total_revenue.get('navy', 1) * 100) if total_revenue.get('navy', 0) != 0 else 0,
-                    'usmc_margin_pct': (net_income.get('usmc', 0) / total_revenue.get('usmc', 1) * 100) if total_revenue.get('usmc', 0) != 0 else 0,
-                    'armp_margin_pct': (net_income.get('armp_total', 0) / total_revenue.get('armp_total', 1) * 100) if total_revenue.get('armp_total', 0) != 0 else 0
+                    'army_margin_pct': margins[1],
+                    'navy_margin_pct': margins[2],
+                    'usmc_margin_pct': margins[3],
+                    'armp_margin_pct': margins[0]
                 }
         
         return performance
@@ -568,26 +1012,34 @@ class FinancialStatementExtractor:
         analysis = {}
         
         for category, items in operating_data.items():
-            if category not in analysis:
-                analysis[category] = {}
+            budget_items = {
+                item_name: values for item_name, values in items.items()
+                if 'march_budget' in values
+            }
+            march_pct = _percent(
+                [values['march_variance'] for values in budget_items.values()],
+                [values['march_budget'] for values in budget_items.values()],
+            ).tolist()
+            ytd_pct = _percent(
+                [values['ytd_variance'] for values in budget_items.values()],
+                [values['ytd_budget'] for values in budget_items.values()],
+            ).tolist()
             
-            for item_name, values in items.items():
-                if isinstance(values, dict) and 'march_budget' in values:
-                    march_budget = values['march_budget']
-                    ytd_budget = values['ytd_budget']
-                    
-                    analysis[category][item_name] = {
-                        'march_variance_pct': (values['march_variance'] / march_budget * 100) if march_budget != 0 else 0,
-                        'ytd_variance_pct': (values['ytd_variance'] / ytd_budget * 100) if ytd_budget != 0 else 0
-                    }
+            analysis[category] = {
+                item_name: {'march_variance_pct': march, 'ytd_variance_pct': ytd}
+                for item_name, march, ytd in zip(budget_items, march_pct, ytd_pct)
+            }
         
         return analysis
+    
     def extract_financial_data(self) -> Dict[str, Dict[str, float]]:
         """
         Extract structured financial data with automatic statement type detection.
         
         This is the main extraction method that automatically detects the statement type
-        and calls the appropriate specialized extraction method.
+        and calls the appropriate specialized extraction method. The result is memoized on
+        the instance, so generate_summary_report() and export_to_dataframes() reuse it
+        instead of parsing the statement again; callers should treat it as read-only.
         
         Returns:
             Dict[str, Dict[str, float]]: Structured financial data. Format depends on statement type:
@@ -595,22 +1047,28 @@ class FinancialStatementExtractor:
                 - Operating results: nested dict with budget vs actual data (6 columns)
                 - Balance sheet: nested dict with assets, liabilities, equity
                 - Unknown: dict with single "unknown_data" key
+                Every line item of a branch or operating statement maps to a dict holding all
+                of that statement's value keys, so consumers can iterate without type checks.
         
         Example:
             >>> extractor = FinancialStatementExtractor("statement.pdf")
             >>> data = extractor.extract_financial_data()
             >>> print(data.keys())  # ['revenue', 'operating_expenses', ...]
         """
+        if self._financial_data is not None:
+            return self._financial_data
+        
         statement_type = self.detect_statement_type()
         
         if statement_type == "branch_breakdown":
-            return self.extract_branch_breakdown()
+            self._financial_data = self.extract_branch_breakdown()
         elif statement_type == "operating_results":
-            return self.extract_operating_results()
+            self._financial_data = self.extract_operating_results()
         elif statement_type == "balance_sheet":
-            return self._extract_balance_sheet_data()
+            self._financial_data = self._extract_balance_sheet_data()
         else:
-            return self._extract_generic_financial_data()
+            self._financial_data = self._extract_generic_financial_data()
+        return self._financial_data
     
     def _extract_balance_sheet_data(self) -> Dict[str, Dict[str, float]]:
         """
@@ -633,21 +1091,11 @@ class FinancialStatementExtractor:
             'equity': {}
         }
         
-        with pdfplumber.open(self.pdf_path) as pdf:
-            for page in pdf.pages:
-                text = page.extract_text()
-                
-                # Extract assets
-                assets_section = self._extract_section(text, "ASSETS", "LIABILITIES")
-                financial_data['assets'].update(self._parse_financial_items(assets_section))
-                
-                # Extract liabilities
-                liabilities_section = self._extract_section(text, "LIABILITIES", "EQUITY")
-                financial_data['liabilities'].update(self._parse_financial_items(liabilities_section))
-                
-                # Extract equity
-                equity_section = self._extract_section(text, "EQUITY", "TOTAL LIABILITIES")
-                financial_data['equity'].update(self._parse_financial_items(equity_section))
+        for text in self._content_page_texts():
+            # Extract assets, liabilities and equity
+            sections = self._extract_sections(text, _BALANCE_SHEET_SECTIONS)
+            for category, section_text in sections.items():
+                financial_data[category].update(self._parse_financial_items(section_text))
         
         return financial_data
     
@@ -662,7 +1110,33 @@ class FinancialStatementExtractor:
         """
         return {"unknown_data": {}}
     
-    def _extract_section(self, text: str, start_marker: str, end_marker: str) -> str:
+    def _extract_sections(self, text: str, sections: Dict[str, Tuple[str, str]]) -> Dict[str, str]:
+        """
+        Extract several marker-delimited sections of a page (private method).
+        
+        Each distinct marker is located once and the positions are shared by all sections,
+        so markers that end one section and start the next are not searched for twice.
+        
+        Args:
+            text (str): Full text to search within.
+            sections (Dict[str, Tuple[str, str]]): Section name -> (start marker, end marker).
+        
+        Returns:
+            Dict[str, str]: Section name -> text as returned by _extract_section().
+        """
+        marker_positions = {}
+        for markers in sections.values():
+            for marker in markers:
+                if marker not in marker_positions:
+                    marker_positions[marker] = text.find(marker)
+        
+        return {
+            name: self._extract_section(text, start_marker, end_marker, marker_positions)
+            for name, (start_marker, end_marker) in sections.items()
+        }
+    
+    def _extract_section(self, text: str, start_marker: str, end_marker: str,
+                         marker_positions: Optional[Dict[str, int]] = None) -> str:
         """
         Extract text between two marker strings (private method).
         
@@ -673,21 +1147,27 @@ class FinancialStatementExtractor:
             text (str): Full text to search within.
             start_marker (str): Text marking the beginning of the section.
             end_marker (str): Text marking the end of the section.
+            marker_positions (Dict[str, int], optional): Precomputed first positions of the
+                markers in text (text.find results). An end marker whose first occurrence
+                lies before the start marker is searched for again from the start marker.
         
         Returns:
             str: Text between the markers, or from start_marker to end if end_marker not found.
-                 Returns empty string if start_marker not found or on error.
+                 Returns empty string if start_marker not found.
         """
-        try:
+        if marker_positions is None:
             start_idx = text.find(start_marker)
             end_idx = text.find(end_marker, start_idx)
-            if start_idx != -1 and end_idx != -1:
-                return text[start_idx:end_idx]
-            elif start_idx != -1:
-                return text[start_idx:]
-            return ""
-        except:
-            return ""
+        else:
+            start_idx = marker_positions[start_marker]
+            end_idx = marker_positions[end_marker]
+            if end_idx < start_idx:
+                end_idx = text.find(end_marker, start_idx)
+        if start_idx != -1 and end_idx != -1:
+            return text[start_idx:end_idx]
+        elif start_idx != -1:
+            return text[start_idx:]
+        return ""
     
     def _parse_financial_items(self, section_text: str) -> Dict[str, float]:
         """
@@ -708,28 +1188,15 @@ class FinancialStatementExtractor:
             - Skips lines that don't match the expected pattern
         """
         items = {}
-        lines = section_text.split('\n')
         
-        for line in lines:
-            # Look for lines with financial amounts
-            # Pattern: text followed by amount (with commas and decimals)
-            match = re.search(r'(.+?)\s+([\d,]+\.?\d*)-?$', line.strip())
-            if match:
-                item_name = match.group(1).strip()
-                amount_str = match.group(2).replace(',', '')
-                
-                try:
-                    # Handle negative amounts (ending with -)
-                    if line.strip().endswith('-'):
-                        amount = -float(amount_str)
-                    else:
-                        amount = float(amount_str)
-                    
-                    # Clean up item names
-                    item_name = re.sub(r'^(Cash--|Less\s+)', '', item_name)
-                    items[item_name] = amount
-                except ValueError:
-                    continue
+        # Look for lines with financial amounts, scanning the whole section in one pass
+        # Pattern: text followed by amount (with commas and decimals)
+        for match in _BALANCE_ITEM_RE.finditer(section_text):
+            item_name, amount_str, sign = match.groups()
+            amount = float(amount_str.replace(',', ''))
+            
+            # Handle negative amounts (ending with -), clean up item names
+            items[_ITEM_PREFIX_RE.sub('', item_name)] = -amount if sign else amount
         
         return items
     
@@ -756,23 +1223,62 @@ class FinancialStatementExtractor:
         """
         text_objects = []
         
-        with pdfplumber.open(self.pdf_path) as pdf:
-            for page_num, page in enumerate(pdf.pages):
-                chars = page.chars
-                for char in chars:
-                    text_objects.append({
-                        'page': page_num + 1,
-                        'text': char['text'],
-                        'x0': char['x0'],
-                        'y0': char['y0'],
-                        'x1': char['x1'],
-                        'y1': char['y1'],
-                        'size': char['size']
-                    })
+        for page in self._get_pages():
+            chars = page.chars
+            for char in chars:
+                text_objects.append({
+                    'page': self._page_number(page),
+                    'text': char['text'],
+                    'x0': char['x0'],
+                    'y0': char['y0'],
+                    'x1': char['x1'],
+                    'y1': char['y1'],
+                    'size': char['size']
+                })
         
         return text_objects
     
-    def export_to_dataframes(self) -> Dict[str, pd.DataFrame]:
+    def extract_coordinate_columns(self) -> Dict[str, np.ndarray]:
+        """
+        Extract the same character data as extract_with_coordinates() in columnar form.
+        
+        Instead of one dict per character, each field is a single preallocated NumPy array
+        filled page by page, which takes far less memory on dense pages and can be passed
+        straight to pd.DataFrame() without per-row schema inference.
+        
+        Returns:
+            Dict[str, np.ndarray]: Equal-length arrays keyed by field:
+                - 'page': int32, 1-based page number
+                - 'text': object, the character
+                - 'x0', 'y0', 'x1', 'y1', 'size': float64 coordinates and font size
+        
+        Example:
+            >>> extractor = FinancialStatementExtractor("statement.pdf")
+            >>> chars = pd.DataFrame(extractor.extract_coordinate_columns())
+        """
+        pages = self._get_pages()
+        page_chars = [page.chars for page in pages]
+        n_chars = sum(len(chars) for chars in page_chars)
+        
+        columns = {
+            'page': np.empty(n_chars, dtype=np.int32),
+            'text': np.empty(n_chars, dtype=object),
+        }
+        for key in _COORDINATE_KEYS:
+            columns[key] = np.empty(n_chars, dtype=np.float64)
+        
+        start = 0
+        for page, chars in zip(pages, page_chars):
+            end = start + len(chars)
+            columns['page'][start:end] = self._page_number(page)
+            columns['text'][start:end] = [char['text'] for char in chars]
+            for key in _COORDINATE_KEYS:
+                columns[key][start:end] = [char[key] for char in chars]
+            start = end
+        
+        return columns
+    
+    def export_to_dataframes(self) -> Dict[str, "pd.DataFrame"]:
         """
         Export financial data to pandas DataFrames for analysis.
         
@@ -803,65 +1309,29 @@ class FinancialStatementExtractor:
         
         if statement_type == "operating_results":
             # Create operating results DataFrame
-            all_items = []
-            for category, items in financial_data.items():
-                for item_name, values in items.items():
-                    if isinstance(values, dict):
-                        row = {
-                            'category': category,
-                            'line_item': item_name,
-                            'march_actual': values.get('march_actual', 0),
-                            'march_budget': values.get('march_budget', 0),
-                            'march_variance': values.get('march_variance', 0),
-                            'ytd_actual': values.get('ytd_actual', 0),
-                            'ytd_budget': values.get('ytd_budget', 0),
-                            'ytd_variance': values.get('ytd_variance', 0)
-                        }
-                        # Calculate variance percentages
-                        row['march_variance_pct'] = (row['march_variance'] / row['march_budget'] * 100) if row['march_budget'] != 0 else 0
-                        row['ytd_variance_pct'] = (row['ytd_variance'] / row['ytd_budget'] * 100) if row['ytd_budget'] != 0 else 0
-                        all_items.append(row)
-            
-            dataframes['operating_results'] = pd.DataFrame(all_items)
+            columns = _to_columns(financial_data, self._BUDGET_KEYS)
+            # Calculate variance percentages
+            columns['march_variance_pct'] = _percent_column(columns['march_variance'], columns['march_budget'])
+            columns['ytd_variance_pct'] = _percent_column(columns['ytd_variance'], columns['ytd_budget'])
+            dataframes['operating_results'] = _columns_to_frame(columns, list(financial_data))
             
         elif statement_type == "branch_breakdown":
             # Create branch breakdown DataFrame
-            all_items = []
-            for category, items in financial_data.items():
-                for item_name, values in items.items():
-                    if isinstance(values, dict):
-                        row = {
-                            'category': category,
-                            'line_item': item_name,
-                            'armp_total': values.get('armp_total', 0),
-                            'army': values.get('army', 0),
-                            'navy': values.get('navy', 0),
-                            'usmc': values.get('usmc', 0)
-                        }
-                        # Calculate branch percentages
-                        total = row['armp_total']
-                        if total != 0:
-                            row['army_pct'] = (row['army'] / total * 100)
-                            row['navy_pct'] = (row['navy'] / total * 100)
-                            row['usmc_pct'] = (row['usmc'] / total * 100)
-                        else:
-                            row['army_pct'] = row['navy_pct'] = row['usmc_pct'] = 0
-                        
-                        all_items.append(row)
-            
-            dataframes['branch_breakdown'] = pd.DataFrame(all_items)
+            columns = _to_columns(financial_data, self._BRANCH_KEYS)
+            # Calculate branch percentages
+            for branch in ('army', 'navy', 'usmc'):
+                columns[f'{branch}_pct'] = _percent_column(columns[branch], columns['armp_total'])
+            dataframes['branch_breakdown'] = _columns_to_frame(columns, list(financial_data))
             
         else:
             # Create balance sheet DataFrame (original logic)
-            all_items = []
+            columns = {'category': [], 'item': [], 'amount': []}
             for category, items in financial_data.items():
                 for item, amount in items.items():
-                    all_items.append({
-                        'category': category,
-                        'item': item,
-                        'amount': amount
-                    })
-            dataframes['balance_sheet'] = pd.DataFrame(all_items)
+                    columns['category'].append(category)
+                    columns['item'].append(item)
+                    columns['amount'].append(amount)
+            dataframes['balance_sheet'] = _columns_to_frame(columns, list(financial_data))
         
         return dataframes
     
@@ -887,46 +1357,43 @@ class FinancialStatementExtractor:
             >>> report = extractor.generate_operating_summary_report(data)
             >>> print(report)
         """
-        report = "OPERATING RESULTS SUMMARY\n"
-        report += "=" * 50 + "\n\n"
+        parts = ["OPERATING RESULTS SUMMARY\n"]
+        parts.append("=" * 50 + "\n\n")
         
         # Key Performance Indicators
         if 'net_revenue' in operating_data and 'Net Revenue' in operating_data['net_revenue']:
             net_rev = operating_data['net_revenue']['Net Revenue']
-            report += "KEY PERFORMANCE INDICATORS:\n"
-            report += f"  YTD Net Revenue: ${net_rev.get('ytd_actual', 0):,.2f}\n"
-            report += f"  YTD Budget: ${net_rev.get('ytd_budget', 0):,.2f}\n"
-            report += f"  YTD Variance: ${net_rev.get('ytd_variance', 0):,.2f}\n\n"
+            parts.append("KEY PERFORMANCE INDICATORS:\n")
+            parts.append(f"  YTD Net Revenue: ${net_rev.get('ytd_actual', 0):,.2f}\n")
+            parts.append(f"  YTD Budget: ${net_rev.get('ytd_budget', 0):,.2f}\n")
+            parts.append(f"  YTD Variance: ${net_rev.get('ytd_variance', 0):,.2f}\n\n")
         
         # Revenue Analysis
         if 'revenue' in operating_data:
-            report += "REVENUE PERFORMANCE:\n"
+            parts.append("REVENUE PERFORMANCE:\n")
             for item, values in operating_data['revenue'].items():
-                if isinstance(values, dict):
-                    ytd_actual = values.get('ytd_actual', 0)
-                    ytd_budget = values.get('ytd_budget', 0)
-                    variance_pct = (values.get('ytd_variance', 0) / ytd_budget * 100) if ytd_budget != 0 else 0
-                    report += f"  {item}:\n"
-                    report += f"    YTD Actual: ${ytd_actual:,.2f}\n"
-                    report += f"    YTD Budget: ${ytd_budget:,.2f}\n"
-                    report += f"    Variance: {variance_pct:+.1f}%\n\n"
+                ytd_actual = values.get('ytd_actual', 0)
+                ytd_budget = values.get('ytd_budget', 0)
+                variance_pct = (values.get('ytd_variance', 0) / ytd_budget * 100) if ytd_budget != 0 else 0
+                parts.append(f"  {item}:\n")
+                parts.append(f"    YTD Actual: ${ytd_actual:,.2f}\n")
+                parts.append(f"    YTD Budget: ${ytd_budget:,.2f}\n")
+                parts.append(f"    Variance: {variance_pct:+.1f}%\n\n")
         
         # Expense Analysis - Top variances
         if 'operating_expenses' in operating_data:
-            report += "TOP EXPENSE VARIANCES (YTD):\n"
+            parts.append("TOP EXPENSE VARIANCES (YTD):\n")
             expense_variances = []
             for item, values in operating_data['operating_expenses'].items():
-                if isinstance(values, dict) and values.get('ytd_budget', 0) != 0:
+                if values.get('ytd_budget', 0) != 0:
                     variance_pct = values.get('ytd_variance', 0) / values.get('ytd_budget', 1) * 100
                     expense_variances.append((item, variance_pct, values.get('ytd_variance', 0)))
             
-            # Sort by absolute variance percentage
-            expense_variances.sort(key=lambda x: abs(x[1]), reverse=True)
-            
-            for item, variance_pct, variance_amount in expense_variances[:5]:
-                report += f"  {item}: {variance_pct:+.1f}% (${variance_amount:+,.2f})\n"
+            # Top 5 by absolute variance percentage (same order and ties as a full reverse sort)
+            for item, variance_pct, variance_amount in heapq.nlargest(5, expense_variances, key=lambda x: abs(x[1])):
+                parts.append(f"  {item}: {variance_pct:+.1f}% (${variance_amount:+,.2f})\n")
         
-        return report
+        return "".join(parts)
     def generate_branch_summary_report(self, branch_data: Dict) -> str:
         """
         Generate a formatted summary report for branch breakdown data.
@@ -949,45 +1416,47 @@ class FinancialStatementExtractor:
             >>> report = extractor.generate_branch_summary_report(data)
             >>> print(report)
         """
-        report = "BRANCH OF SERVICE PERFORMANCE SUMMARY\n"
-        report += "=" * 55 + "\n\n"
+        parts = ["BRANCH OF SERVICE PERFORMANCE SUMMARY\n"]
+        parts.append("=" * 55 + "\n\n")
         
         # Revenue breakdown
         if 'revenue' in branch_data:
-            report += "REVENUE BY BRANCH:\n"
+            parts.append("REVENUE BY BRANCH:\n")
             for item, values in branch_data['revenue'].items():
-                if isinstance(values, dict):
-                    total = values.get('armp_total', 0)
-                    army_pct = (values.get('army', 0) / total * 100) if total != 0 else 0
-                    navy_pct = (values.get('navy', 0) / total * 100) if total != 0 else 0
-                    usmc_pct = (values.get('usmc', 0) / total * 100) if total != 0 else 0
-                    
-                    report += f"  {item}: ${total:,.2f}\n"
-                    report += f"    Army: ${values.get('army', 0):,.2f} ({army_pct:.1f}%)\n"
-                    report += f"    Navy: ${values.get('navy', 0):,.2f} ({navy_pct:.1f}%)\n"
-                    report += f"    USMC: ${values.get('usmc', 0):,.2f} ({usmc_pct:.1f}%)\n\n"
+                total = values.get('armp_total', 0)
+                army = values.get('army', 0)
+                navy = values.get('navy', 0)
+                usmc = values.get('usmc', 0)
+                army_pct = (army / total * 100) if total != 0 else 0
+                navy_pct = (navy / total * 100) if total != 0 else 0
+                usmc_pct = (usmc / total * 100) if total != 0 else 0
+                
+                parts.append(f"  {item}: ${total:,.2f}\n")
+                parts.append(f"    Army: ${army:,.2f} ({army_pct:.1f}%)\n")
+                parts.append(f"    Navy: ${navy:,.2f} ({navy_pct:.1f}%)\n")
+                parts.append(f"    USMC: ${usmc:,.2f} ({usmc_pct:.1f}%)\n\n")
         
         # Operating performance by branch
         if 'net_operating_income' in branch_data:
-            report += "OPERATING INCOME BY BRANCH:\n"
+            parts.append("OPERATING INCOME BY BRANCH:\n")
             net_ops = branch_data['net_operating_income'].get('Net Operating Income', {})
             if net_ops:
-                report += f"  Total: ${net_ops.get('armp_total', 0):,.2f}\n"
-                report += f"    Army: ${net_ops.get('army', 0):,.2f}\n"
-                report += f"    Navy: ${net_ops.get('navy', 0):,.2f}\n"
-                report += f"    USMC: ${net_ops.get('usmc', 0):,.2f}\n\n"
+                parts.append(f"  Total: ${net_ops.get('armp_total', 0):,.2f}\n")
+                parts.append(f"    Army: ${net_ops.get('army', 0):,.2f}\n")
+                parts.append(f"    Navy: ${net_ops.get('navy', 0):,.2f}\n")
+                parts.append(f"    USMC: ${net_ops.get('usmc', 0):,.2f}\n\n")
         
         # Calculate and show profit margins
         performance = self.calculate_branch_performance(branch_data)
         if 'Operating Margin' in performance:
             margins = performance['Operating Margin']
-            report += "OPERATING MARGINS BY BRANCH:\n"
-            report += f"  Army: {margins.get('army_margin_pct', 0):.1f}%\n"
-            report += f"  Navy: {margins.get('navy_margin_pct', 0):.1f}%\n"
-            report += f"  USMC: {margins.get('usmc_margin_pct', 0):.1f}%\n"
-            report += f"  Overall: {margins.get('armp_margin_pct', 0):.1f}%\n\n"
+            parts.append("OPERATING MARGINS BY BRANCH:\n")
+            parts.append(f"  Army: {margins.get('army_margin_pct', 0):.1f}%\n")
+            parts.append(f"  Navy: {margins.get('navy_margin_pct', 0):.1f}%\n")
+            parts.append(f"  USMC: {margins.get('usmc_margin_pct', 0):.1f}%\n")
+            parts.append(f"  Overall: {margins.get('armp_margin_pct', 0):.1f}%\n\n")
         
-        return report
+        return "".join(parts)
     def generate_summary_report(self) -> str:
         """
         Generate an appropriate summary report based on the detected statement type.
@@ -1037,21 +1506,24 @@ class FinancialStatementExtractor:
             >>> report = extractor.generate_balance_sheet_summary_report(data)
             >>> print(report)
         """
-        report = "FINANCIAL STATEMENT SUMMARY\n"
-        report += "=" * 40 + "\n\n"
+        parts = ["FINANCIAL STATEMENT SUMMARY\n"]
+        parts.append("=" * 40 + "\n\n")
         
         for category, items in financial_data.items():
             if items:
-                report += f"{category.upper()}:\n"
+                parts.append(f"{category.upper()}:\n")
                 total = 0
                 for item, amount in items.items():
-                    report += f"  {item}: ${amount:,.2f}\n"
+                    parts.append(f"  {item}: ${amount:,.2f}\n")
                     total += amount
-                report += f"  TOTAL {category.upper()}: ${total:,.2f}\n\n"
+                parts.append(f"  TOTAL {category.upper()}: ${total:,.2f}\n\n")
         
-        return report
+        return "".join(parts)
+
+# Keys of the dict returned by format_report_df(), in order
+_REPORT_FIELDS = ("full_text", "tables", "financial_data", "summary_report", "dataframes")
 
-def format_report_df(extractor):
+def format_report_df(extractor, cache_dir=None, fields=None):
     """
     Format a comprehensive report dictionary from a FinancialStatementExtractor instance.
     
@@ -1060,9 +1532,21 @@ def format_report_df(extractor):
     
     Args:
         extractor (FinancialStatementExtractor): Initialized extractor instance.
+        cache_dir (str, optional): Directory for an on-disk cache of reports. When given, the
+                                 report is pickled as
+                                 <cache_dir>/report_<hash of the PDF>_<hash of this module>.pkl
+                                 and a later call for the same PDF contents loads it without
+                                 parsing the PDF. Editing this module starts new entries, so a
+                                 parser fix is never masked by stale reports. An extractor
+                                 created with force_refresh=True skips the lookup and overwrites
+                                 the entry. An entry that cannot be unpickled is removed and
+                                 rebuilt.
+        fields (Iterable[str], optional): Report keys to compute, e.g. ("dataframes",) when only
+                                        the DataFrames are written out. Defaults to all keys;
+                                        skipping "tables" avoids pdfplumber's table finder.
     
     Returns:
-        Dict: Comprehensive report dictionary with keys:
+        Dict: Comprehensive report dictionary with keys (limited to fields when given):
             - "full_text": Complete PDF text content
             - "tables": List of extracted DataFrames from tables
             - "financial_data": Structured financial data dictionary
@@ -1075,22 +1559,57 @@ def format_report_df(extractor):
         >>> print(report.keys())
         dict_keys(['full_text', 'tables', 'financial_data', 'summary_report', 'dataframes'])
     """
+    if fields is None:
+        fields = _REPORT_FIELDS
+    else:
+        requested = set(fields)
+        unknown = requested.difference(_REPORT_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown report fields: {sorted(unknown)}")
+        fields = tuple(field for field in _REPORT_FIELDS if field in requested)
+    
+    if cache_dir is not None:
+        cache_dir = os.path.expanduser(cache_dir)
+        cache_name = f"report_{_cache_key(extractor.pdf_path)}"
+        if fields != _REPORT_FIELDS:
+            cache_name += "_" + "-".join(fields)
+        cache_name += extractor._cache_name_suffix()
+        cache_file = os.path.join(cache_dir, f"{cache_name}.pkl")
+        if not extractor.force_refresh and os.path.exists(cache_file):
+            try:
+                with open(cache_file, 'rb') as f:
+                    return pickle.load(f)
+            except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+                # A truncated or stale entry is dropped and the report is rebuilt below
+                try:
+                    os.remove(cache_file)
+                except OSError:
+                    pass
+    
     report = dict()
     
-    full_text = extractor.extract_all_text()
-    report["full_text"] = full_text
+    if "full_text" in fields:
+        full_text = extractor.extract_all_text()
+        report["full_text"] = full_text
     
-    tables = extractor.extract_tables()
-    report["tables"] = tables
+    if "tables" in fields:
+        tables = extractor.extract_tables()
+        report["tables"] = tables
     
-    financial_data = extractor.extract_financial_data()
-    report["financial_data"] = financial_data
+    if "financial_data" in fields:
+        financial_data = extractor.extract_financial_data()
+        report["financial_data"] = financial_data
     
-    summary_report = extractor.generate_summary_report()
-    report["summary_report"] = summary_report
+    if "summary_report" in fields:
+        summary_report = extractor.generate_summary_report()
+        report["summary_report"] = summary_report
     
-    dataframes = extractor.export_to_dataframes()
-    report["dataframes"] = dataframes
+    if "dataframes" in fields:
+        dataframes = extractor.export_to_dataframes()
+        report["dataframes"] = dataframes
+    
+    if cache_dir is not None:
+        _atomic_write(cache_file, partial(pickle.dump, report, protocol=pickle.HIGHEST_PROTOCOL), mode='wb')
     
     return report
 
@@ -1127,12 +1646,52 @@ def output_report(report_df, output_dir, page_num=None):
         df.to_csv(output_file, index=False)
         print(f"Saved {output_file}")
 
+def output_combined_report(page_reports, output_dir):
+    """
+    Output the report DataFrames of many pages as one CSV per DataFrame name.
+    
+    Instead of one small file per (page, DataFrame), each "{df_name}_all.csv" is opened once
+    and every page's rows are appended to it as that page's report arrives, with a leading
+    "page" column recording the page each row came from. Reports are not held in memory, so
+    this can consume results straight from a worker pool. Pages whose DataFrame is empty add
+    no rows, and each page's values are formatted exactly as output_report() writes them.
+    
+    Args:
+        page_reports (Iterable[Tuple[int, Dict]]): (page_num, report) pairs, where each report
+                                                  comes from format_report_df().
+        output_dir (str): Directory path where CSV files will be saved. Files are named
+                         "{df_name}_all.csv".
+    
+    Side Effects:
+        - Creates one CSV file per DataFrame name in the output directory
+        - Prints confirmation messages for each saved file
+    
+    Example:
+        >>> reports = [(1, format_report_df(FinancialStatementExtractor("page_001.pdf")))]
+        >>> output_combined_report(reports, "/output/dir")
+        Saved /output/dir/operating_results_all.csv
+    """
+    files = {}
+    try:
+        for page_num, report_df in page_reports:
+            for df_name, df in report_df["dataframes"].items():
+                if df.empty:
+                    continue
+                df = df.assign(page=page_num)
+                df.insert(0, 'page', df.pop('page'))
+                f = files.get(df_name)
+                write_header = f is None
+                if write_header:
+                    f = files[df_name] = open(f"{output_dir}/{df_name}_all.csv", 'w', newline='')
+                df.to_csv(f, index=False, header=write_header)
+    finally:
+        for f in files.values():
+            f.close()
+    
+    for f in files.values():
+        print(f"Saved {f.name}")
+
 if __name__ == "__main__":
-    for i in range(712):
-        page_num = i + 1
-        print(f"page_num: {page_num:03}")
-        source_pdf_base_path = "/Users/brentbrewington/Downloads/Data/Financial Statements_page_"
-        extractor = FinancialStatementExtractor(f"{source_pdf_base_path}{page_num:03}.pdf")
-        report = format_report_df(extractor)
-        output_report(report, page_num=page_num)
-        del extractor
+    # Same 712-page run as main.py, where each page PDF is processed in a worker process
+    from main import main
+    main()
@@ -1,34 +1,71 @@
+import csv
+import itertools
+import os
 import pdfplumber
-from typing import List, TypedDict
-import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Iterable, Iterator, List, Optional, TypedDict
+
+from financial_statement_extractor import PAGES_PER_TASK, count_pages
 
 class FileMeta(TypedDict):
     file_path: str
     header_items: List[str]
 
-def extract_headers_from_pdf(pdf_path: str, n_lines: int = 4) -> List[FileMeta]:
-    """Extract the first n_lines of text from each page in the PDF."""
+def extract_headers_from_page_range(pdf_path: str, page_range: range, n_lines: int = 4) -> List[FileMeta]:
+    """Extract the first n_lines of text from the pages in page_range (zero-based) of the PDF."""
     page_meta_list: List[FileMeta] = []
-    with pdfplumber.open(pdf_path) as pdf:
-        for page_num, page in enumerate(pdf.pages, start=1):
-            print(page_num)
+    # Only the pages in the range are loaded by pdfplumber
+    with pdfplumber.open(pdf_path, pages=[i + 1 for i in page_range]) as pdf:
+        for page in pdf.pages:
+            print(page.page_number)
             text = page.extract_text() or ""
             header_items = text.split("\n")[:n_lines]
+            # Release the parsed page layout so memory stays flat over large PDFs
+            page.close()
             page_meta_list.append({
                 "file_path": f"{pdf_path}",
-                "page": page_num,
+                "page": page.page_number,
                 "header_items": header_items
             })
     return page_meta_list
 
-pdf_path = "/Users/brentbrewington/Downloads/Data/Financial Statements.pdf"
-page_meta_list = extract_headers_from_pdf(pdf_path)
+def iter_headers_from_pdf(pdf_path: str, n_lines: int = 4, max_workers: Optional[int] = None) -> Iterator[FileMeta]:
+    """
+    Yield the first n_lines of text from each page in the PDF, in page order.
+    
+    Pages are read in worker processes, PAGES_PER_TASK pages per task (see
+    FinancialStatementExtractor._read_page_texts for why), and yielded as each task finishes.
+    """
+    n_pages = count_pages(pdf_path)
+    page_ranges = [range(start, min(start + PAGES_PER_TASK, n_pages)) for start in range(0, n_pages, PAGES_PER_TASK)]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for page_meta_list in executor.map(partial(extract_headers_from_page_range, pdf_path, n_lines=n_lines), page_ranges):
+            yield from page_meta_list
+
+def extract_headers_from_pdf(pdf_path: str, n_lines: int = 4, max_workers: Optional[int] = None) -> List[FileMeta]:
+    """Extract the first n_lines of text from each page in the PDF."""
+    return list(iter_headers_from_pdf(pdf_path, n_lines, max_workers))
 
-# Example: preview first 3 pages
-for meta in page_meta_list[:3]:
-    print(meta)
+def write_page_metadata(page_meta_list: Iterable[FileMeta], csv_path: str, n_lines: int = 4) -> None:
+    """Write page metadata to a CSV row by row, with one header_N column per header line."""
+    with open(csv_path, "w", newline="") as f:
+        # Same layout (and line endings) as DataFrame.to_csv, including the unnamed index column
+        writer = csv.writer(f, lineterminator=os.linesep)
+        writer.writerow(["", "file_path", "page", "header_items", *(f"header_{i}" for i in range(1, n_lines + 1))])
+        for index, meta in enumerate(page_meta_list):
+            header_items = meta["header_items"]
+            padding = [""] * (n_lines - len(header_items))
+            writer.writerow([index, meta["file_path"], meta["page"], header_items, *header_items, *padding])
 
-df = pd.DataFrame(page_meta_list)
-df2 = df.copy()
-df2[['header_1', 'header_2', 'header_3', 'header_4']] = pd.DataFrame(df2.header_items.tolist(), index= df2.index)
-df2.to_csv('page_metadata.csv')
+if __name__ == "__main__":
+    pdf_path = "/Users/brentbrewington/Downloads/Data/Financial Statements.pdf"
+    page_metas = iter_headers_from_pdf(pdf_path)
+    
+    # Example: preview first 3 pages
+    first_page_metas = list(itertools.islice(page_metas, 3))
+    for meta in first_page_metas:
+        print(meta)
+    
+    # Pages are written as they are extracted instead of being collected in a DataFrame first
+    write_page_metadata(itertools.chain(first_page_metas, page_metas), 'page_metadata.csv')
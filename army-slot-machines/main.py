@@ -1,26 +1,88 @@
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
 from split_pdf import split_pdf
-from financial_statement_extractor import FinancialStatementExtractor, format_report_df, output_report
+from financial_statement_extractor import (
+    PAGES_PER_TASK, FinancialStatementExtractor, format_report_df, output_report, output_combined_report
+)
 
 START_PAGE = 1
 END_PAGE = 712 # change this to a number like 10 to do a smaller scope run
+SOURCE_PDF_BASE_PATH = "/Users/brentbrewington/Downloads/Data/Financial Statements_page_"
+# Financial Statements.pdf has 712 pages
+SOURCE_PDF_PATH = "/Users/brentbrewington/Downloads/Data/Financial Statements.pdf"
+OUTPUT_DIR = "data_need_to_qa"
+
+def process_page(page_num, source_pdf_base_path=SOURCE_PDF_BASE_PATH, output_dir=OUTPUT_DIR, combine_output=False,
+                 cache_dir=None):
+    """
+    Extract one split page PDF and write its report CSVs.
+    
+    Defined at module scope so it can be run in a worker process; every page is an
+    independent PDF, so pages can be processed in any order. With combine_output the
+    report is returned to the caller instead of being written per page. With cache_dir
+    the report is cached on disk by format_report_df, keyed by the page PDF's contents.
+    """
+    print(f"page_num: {page_num:03}")
+    with FinancialStatementExtractor(f"{source_pdf_base_path}{page_num:03}.pdf") as extractor:
+        # Only the DataFrames are written out, so skip the text and table extraction
+        report = format_report_df(extractor, cache_dir=cache_dir, fields=("dataframes",))
+    if combine_output:
+        return report
+    output_report(report, output_dir=output_dir, page_num=page_num)
+
+def process_pages(page_nums, source_pdf_path=SOURCE_PDF_PATH, output_dir=OUTPUT_DIR, combine_output=False,
+                  cache_dir=None):
+    """
+    Extract a slice of pages straight from the full PDF and write their report CSVs.
+    
+    The PDF is opened once for the whole slice and every page is read through that one
+    handle, instead of re-parsing the file (or a split copy of it) for each page. With
+    combine_output the reports are returned in page order instead of being written.
+    cache_dir is passed to format_report_df as in process_page().
+    """
+    reports = []
+    page_indices = [page_num - 1 for page_num in page_nums]
+    for extractor in FinancialStatementExtractor.iter_pages(source_pdf_path, page_indices):
+        page_num = extractor.page_index + 1
+        print(f"page_num: {page_num:03}")
+        report = format_report_df(extractor, cache_dir=cache_dir, fields=("dataframes",))
+        if combine_output:
+            reports.append(report)
+        else:
+            output_report(report, output_dir=output_dir, page_num=page_num)
+    return reports
 
-def main(run_split=False):
-    if run_split:
+def main(run_split=False, max_workers=None, combine_output=False, from_full_pdf=False, cache_dir=None):
+    # With cache_dir (e.g. "~/.cache/army-slot-machines"), a rerun on unchanged PDFs loads each
+    # page's report from disk instead of extracting it. Entries are also keyed by the extractor's
+    # source, so editing it invalidates them.
+    # With from_full_pdf, every page is read out of SOURCE_PDF_PATH, so no split files are
+    # written or needed.
+    if run_split and not from_full_pdf:
         split_pdf(
-            # Financial Statements.pdf has 712 pages
-            file_path="/Users/brentbrewington/Downloads/Data/Financial Statements.pdf",
+            file_path=SOURCE_PDF_PATH,
             name_template="/Users/brentbrewington/Downloads/Data_temp/Financial Statements_page_{:03}.pdf"
         )
     
-    for i in range(START_PAGE, END_PAGE + 1):
-        page_num = i
-        print(f"page_num: {page_num:03}")
-        source_pdf_base_path = "/Users/brentbrewington/Downloads/Data/Financial Statements_page_"
-        extractor = FinancialStatementExtractor(f"{source_pdf_base_path}{page_num:03}.pdf")
-        report = format_report_df(extractor)
-        output_report(report, output_dir="data_need_to_qa", page_num=page_num)
-        del extractor
+    # Pages are spread over processes, see FinancialStatementExtractor._read_page_texts
+    page_nums = range(START_PAGE, END_PAGE + 1)
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        if from_full_pdf:
+            page_slices = [page_nums[i:i + PAGES_PER_TASK] for i in range(0, len(page_nums), PAGES_PER_TASK)]
+            reports = itertools.chain.from_iterable(executor.map(
+                partial(process_pages, source_pdf_path=SOURCE_PDF_PATH, combine_output=combine_output, cache_dir=cache_dir),
+                page_slices))
+        else:
+            reports = executor.map(partial(process_page, combine_output=combine_output, cache_dir=cache_dir), page_nums,
+                                   chunksize=8)
+        if combine_output:
+            # One CSV per statement type (e.g. operating_results_all.csv) instead of one per page
+            output_combined_report(zip(page_nums, reports), output_dir=OUTPUT_DIR)
+        else:
+            list(reports)
 
 if __name__ == "__main__":
     main()
-
@@ -1,48 +1,55 @@
+import re
+
 import pandas as pd
-from numpy import nan
 
-df = pd.read_csv("/Users/brentbrewington/Downloads/24-F-0024_FY16-FY23_Final.xlsx - FOIA24-F-0024.csv")
+csv_path = "/Users/brentbrewington/Downloads/24-F-0024_FY16-FY23_Final.xlsx - FOIA24-F-0024.csv"
 
 int_col_abbrs = ["F5", "F13A", "F13F", "F13G", "F13H", "F26", "F34"]
-int_col_names = list()
-for abbr in int_col_abbrs:
-    for col in df.columns:
-        if col.find(abbr) > -1:
-            int_col_names.append(col)
+# Columns whose name contains any of the abbreviations, found from the header row alone
+columns = pd.read_csv(csv_path, nrows=0).columns
+int_col_names = columns[columns.str.contains("|".join(re.escape(abbr) for abbr in int_col_abbrs))].tolist()
 
-for int_col_name in int_col_names:
-    df.loc[df[int_col_name] == " ", int_col_name] = nan
-    df[int_col_name] = df[int_col_name].astype('Int64')
+# Blank cells (" ") in the integer columns are read as missing values, parsed straight into Int64
+df = pd.read_csv(csv_path, dtype=dict.fromkeys(int_col_names, 'Int64'), na_values=dict.fromkeys(int_col_names, [" "]))
 
 def series_to_unique_set(pd_series):
-    if len(pd_series.unique()) == 1:
-        return_val = list(pd_series.unique())[0]
+    unique_values = pd_series.unique()
+    if len(unique_values) == 1:
+        return_val = unique_values[0]
     else:
-        return_val = sorted(list({x for x in ''.join({x for x in pd_series})}))
+        # Collect the characters of each distinct value instead of joining them into one string
+        chars = set()
+        for value in unique_values:
+            chars.update(value)
+        return_val = sorted(chars)
     return return_val
 
-unique_report = str()
+report_parts = []
 
 for col in df:
     col_series = df[col]
-    cardinality = len(col_series.unique())
-    unique_report += col + "\n" + "-" * len(col) + "\n" + "Cardinality: " + str(cardinality) + "\n"
+    # Distinct values (including missing) are computed once; sorting them is far cheaper than sorting the column
+    distinct = pd.Series(col_series.unique())
+    cardinality = len(distinct)
+    report_parts.append(col + "\n" + "-" * len(col) + "\n" + "Cardinality: " + str(cardinality) + "\n")
     if col in int_col_names:
         min_val, max_val = col_series.min(), col_series.max()
-        unique_report += f"Range: {min_val} - {max_val}"
+        report_parts.append(f"Range: {min_val} - {max_val}")
     elif cardinality == 1:
-        unique_report += f"Single value: {col_series[0]}\n"
+        report_parts.append(f"Single value: {col_series[0]}\n")
     elif cardinality <= 15:
-        unique_values = ["'" + x + "'" for x in col_series.sort_values().unique().tolist()]
-        unique_report += "Unique values: " + ', '.join(unique_values) + "\n"
-        unique_elements = ["'" + x + "'" for x in series_to_unique_set(col_series)]
-        unique_report += "Unique elements: " + ', '.join(unique_elements) + "\n"
+        unique_values = ["'" + x + "'" for x in distinct.sort_values().tolist()]
+        report_parts.append("Unique values: " + ', '.join(unique_values) + "\n")
+        unique_elements = ["'" + x + "'" for x in series_to_unique_set(distinct)]
+        report_parts.append("Unique elements: " + ', '.join(unique_elements) + "\n")
     else:
-        top_5 = col_series.sort_values(ascending=False).unique()[:5].tolist()
-        bottom_5 = col_series.sort_values().unique()[:5].tolist()
-        unique_report += 'Top 5 unique values: ' + ", ".join(["'" + str(x) + "'" for x in top_5]) + "\n\n"
-        unique_report += 'Bottom 5 unique values: ' + ", ".join(["'" + str(x) + "'" for x in bottom_5]) + "\n\n"
-    unique_report += "\n"
+        top_5 = distinct.sort_values(ascending=False).head(5).tolist()
+        bottom_5 = distinct.sort_values().head(5).tolist()
+        report_parts.append('Top 5 unique values: ' + ", ".join(["'" + str(x) + "'" for x in top_5]) + "\n\n")
+        report_parts.append('Bottom 5 unique values: ' + ", ".join(["'" + str(x) + "'" for x in bottom_5]) + "\n\n")
+    report_parts.append("\n")
+
+unique_report = "".join(report_parts)
 
 print(unique_report)
 